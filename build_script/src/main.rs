@@ -58,41 +58,57 @@ fn main() {
 
     let resources = Path::new("resources/");
 
-    // SVG blender runs (parallel)
-    let mut svg_handles = Vec::new();
-    for svg_path in load_recursively(resources, OsStr::new("svg")) {
-        let out_path = svg_path.with_extension("blend");
-
-        if file_check(&svg_path, &out_path) {
-            svg_handles.push(thread::spawn(move || {
-                let output = Command::new("blender")
-                    .args([
-                        "--background",
-                        "--python-exit-code",
-                        "1",
-                        "--python",
-                        "scripts/export_svg.py",
-                        "--",
-                    ])
-                    .arg(svg_path)
-                    .arg(out_path)
-                    .stdout(Stdio::piped())
-                    .stderr(Stdio::piped())
-                    .spawn()
-                    .expect("blender processing couldn't start")
-                    .wait_with_output()
-                    .unwrap();
-                println!("{}", str::from_utf8(&output.stdout).unwrap());
+    // SVG blender runs (parallel, batched so each blender process handles
+    // several files instead of paying its startup cost per file)
+    let svg_jobs = load_recursively(resources, OsStr::new("svg"))
+        .into_iter()
+        .map(|svg_path| {
+            let out_path = svg_path.with_extension("blend");
+            (svg_path, out_path)
+        })
+        .filter(|(svg_path, out_path)| file_check(svg_path, out_path))
+        .collect::<Vec<_>>();
+
+    let threads = thread::available_parallelism()
+        .map(|v| v.get())
+        .unwrap_or(1);
+    let chunk_size = ((svg_jobs.len() + threads - 1) / threads).max(1);
 
-                if !output.status.success() {
-                    panic!(
-                        "Process bad status code: {}\n{}",
-                        output.status,
-                        String::from_utf8(output.stderr).unwrap()
-                    )
-                }
-            }));
-        }
+    let mut svg_handles = Vec::new();
+    for chunk in svg_jobs.chunks(chunk_size) {
+        let chunk = chunk.to_vec();
+
+        svg_handles.push(thread::spawn(move || {
+            let mut command = Command::new("blender");
+            command.args([
+                "--background",
+                "--python-exit-code",
+                "1",
+                "--python",
+                "scripts/export_svg.py",
+                "--",
+            ]);
+            for (svg_path, out_path) in &chunk {
+                command.arg(svg_path).arg(out_path);
+            }
+
+            let output = command
+                .stdout(Stdio::piped())
+                .stderr(Stdio::piped())
+                .spawn()
+                .expect("blender processing couldn't start")
+                .wait_with_output()
+                .unwrap();
+            println!("{}", str::from_utf8(&output.stdout).unwrap());
+
+            if !output.status.success() {
+                panic!(
+                    "Process bad status code: {}\n{}",
+                    output.status,
+                    String::from_utf8(output.stderr).unwrap()
+                )
+            }
+        }));
     }
     for handle in svg_handles {
         if handle.join().is_err() {
@@ -1,44 +1,30 @@
-import bmesh
 import bpy
+import numpy as np
 import sys
 
 def main():
     dst = sys.argv[-1]
 
-    if bpy.context.active_object:
-        bpy.context.active_object.select_set(False)
-
-    for obj in filter(lambda o: o.type == 'MESH', bpy.data.objects):
-        bpy.context.view_layer.objects.active = obj
-
-        bpy.ops.object.mode_set(mode='EDIT')
-        bm = bmesh.from_edit_mesh(bpy.context.edit_object.data)
-        for v in bm.faces:
-            v.select = True
-        for v in bm.edges:
-            v.select = True
-        for v in bm.verts:
-            v.select = True
-
-        # post processing...
-        # ...
-
-        bmesh.update_edit_mesh(bpy.context.edit_object.data)
+    if bpy.context.mode != 'OBJECT':
         bpy.ops.object.mode_set(mode='OBJECT')
 
+    for obj in (o for o in bpy.data.objects if o.type == 'MESH'):
         if not obj.data.color_attributes and obj.active_material:
             obj.data.color_attributes.new(name='Col', type='FLOAT_COLOR', domain='CORNER')
 
-            color = obj.active_material.diffuse_color
+            color = np.asarray(obj.active_material.diffuse_color, dtype=np.float32)
 
-            for datum in obj.data.attributes.active_color.data:
-                datum.color = color
+            buf = np.tile(color, len(obj.data.loops))
+            obj.data.attributes.active_color.data.foreach_set('color', buf)
             
             obj.data.materials.clear()
 
+    # only evaluate the modifier stack during export if something actually uses it
+    needs_apply = any(obj.modifiers for obj in bpy.data.objects)
+
     bpy.ops.export_scene.gltf(filepath=dst, check_existing=False, export_format='GLB',
                               export_image_format='NONE', export_texcoords=False, export_materials='NONE',
-                              export_apply=True, export_skins=False, export_lights=False, export_yup=False,
+                              export_apply=needs_apply, export_skins=False, export_lights=False, export_yup=False,
                               will_save_settings=False, export_draco_mesh_compression_enable=False)
 
 
@@ -3,66 +3,92 @@ import bpy
 import sys
 import xml.etree.ElementTree as ET
 
-def main():
-    src = sys.argv[-2]
-    print(src)
+from mathutils import Matrix
 
-    dst = sys.argv[-1]
+SVG_NS = 'http://www.w3.org/2000/svg'
+SVG_PATH = f'{{{SVG_NS}}}path'
 
-    for obj in bpy.data.objects:
-        bpy.data.objects.remove(obj)
+def convert(src, dst):
+    print(src)
+
+    # wipe everything a previous conversion may have left behind: the svg
+    # importer creates a collection named after the file, plus curve
+    # datablocks and their materials, besides the objects and meshes
+    for data in (bpy.data.objects, bpy.data.collections, bpy.data.curves,
+                 bpy.data.meshes, bpy.data.materials):
+        bpy.data.batch_remove(ids=list(data))
 
     tree = ET.parse(src)
     root = tree.getroot()
 
-    attribs = [path.attrib for path in root.iter('{http://www.w3.org/2000/svg}path')]
-    ids = dict(map(lambda e: (e[1], e[0]), enumerate(map(lambda a: a['id'], attribs))))
-    total = float(len(attribs))
+    ids = {}
+    styles = {}
+    for i, path in enumerate(root.iter(SVG_PATH)):
+        pid = path.attrib['id']
+        ids[pid] = i
+        style = path.attrib.get('style', '')
+        styles[pid] = {k.strip(): v.strip()
+                       for k, sep, v in (decl.partition(':') for decl in style.split(';'))
+                       if sep}
+    total = float(len(ids))
 
     bpy.ops.import_curve.svg(filepath=src)
 
-    curves = list(filter(lambda o: o.type == 'CURVE', bpy.data.objects))
+    curves = [o for o in bpy.data.objects if o.type == 'CURVE']
+    to_remove = []
+    pending = []
+
+    new_mesh = bpy.data.meshes.new_from_object
+    new_object = bpy.data.objects.new
+    link = bpy.context.collection.objects.link
+
+    edge_smallen_ratio = 0.95
+    edge_offset = 1.0 - edge_smallen_ratio
+    # shrink to an eighth of the tile, pulled in slightly from the edges
+    scale = Matrix.Diagonal((edge_smallen_ratio / 8.0, edge_smallen_ratio / 8.0, 1.0, 1.0))
 
     for obj in curves:
-        mesh = bpy.data.meshes.new_from_object(obj)
+        mesh = new_mesh(obj)
 
-        new_obj = bpy.data.objects.new(obj.name, mesh)
+        new_obj = new_object(obj.name, mesh)
 
-        new_obj.matrix_world = obj.matrix_world
-        new_obj.delta_location.z = (ids[obj.name] / total) / 64.0 + 0.005
+        z = (ids[obj.name] / total) / 64.0 + 0.005
+        mat = Matrix.Translation((edge_offset, edge_offset, z)) @ obj.matrix_world @ scale
+        new_obj.matrix_world = mat
         #alpha = styles[obj.name].get('fill-opacity')
         #if alpha:
         #    new_obj.active_material.diffuse_color[3] = float(alpha)
-        bpy.context.collection.objects.link(new_obj)
-        bpy.data.objects.remove(obj)
+        pending.append((new_obj, mat))
+        to_remove.append(obj)
+
+    for new_obj, _ in pending:
+        link(new_obj)
 
-        edge_smallen_ratio = 0.95
+    for new_obj, mat in pending:
+        bm = bmesh.new()
+        try:
+            bm.from_mesh(new_obj.data)
 
-        new_dim = new_obj.dimensions.copy()
-        new_dim.x = (new_dim.x / 8.0) * edge_smallen_ratio
-        new_dim.y = (new_dim.y / 8.0) * edge_smallen_ratio
-        new_obj.dimensions = new_dim
+            bmesh.ops.translate(bm, vec=(-1.0, -1.0, 0.0), space=mat, verts=bm.verts)
+            bmesh.ops.remove_doubles(bm, verts=bm.verts, dist=0.05)
 
-        new_obj.delta_location.x += 1.0 - edge_smallen_ratio
-        new_obj.delta_location.y += 1.0 - edge_smallen_ratio
+            bm.to_mesh(new_obj.data)
+        finally:
+            bm.free()
 
-        bpy.context.view_layer.objects.active = new_obj
-        bpy.ops.object.mode_set(mode='EDIT')
-        bm = bmesh.from_edit_mesh(bpy.context.edit_object.data)
-        for v in bm.faces:
-            v.select = True
-        for v in bm.edges:
-            v.select = True
-        for v in bm.verts:
-            v.select = True
+    bpy.data.batch_remove(ids=to_remove)
 
-        bmesh.ops.translate(bm, vec=(-1.0, -1.0, 0.0), space=bpy.context.object.matrix_world, verts=bm.verts)
-        bpy.ops.mesh.remove_doubles(threshold=0.05)
+    bpy.ops.wm.save_as_mainfile(filepath=dst, compress=False, check_existing=False)
 
-        bmesh.update_edit_mesh(bpy.context.edit_object.data)
-        bpy.ops.object.mode_set(mode='OBJECT')
 
-    bpy.ops.wm.save_mainfile(filepath=dst)
+def main():
+    # any number of src/dst pairs after '--', so one blender process can
+    # convert a whole batch of SVGs
+    argv = sys.argv
+    argv = argv[argv.index('--') + 1:] if '--' in argv else argv[-2:]
+
+    for src, dst in zip(argv[::2], argv[1::2]):
+        convert(src, dst)
 
 
 if __name__ == "__main__":